@@ -1,9 +1,12 @@
 # Automata.py
 
 # Import librarires
-from multiprocessing import Process
+from multiprocessing import Process, connection
 from flask import Flask
 import os
+import signal
+import sys
+import time
 
 # Import modules
 from routers.utilities.terminalTools import Logger, CsvManager
@@ -14,6 +17,14 @@ from discordBot import run_bot
 log: CsvManager = CsvManager("log")
 logger: Logger = Logger(log)
 
+# Segundos de gracia tras terminate() antes de usar kill()
+_STOP_TIMEOUT: float = 5.0
+
+def _run_service(target) -> None:
+    # Los hijos no heredan el manejador de Ctrl+C de Automata
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    target()
+
 # Automata main
 class Automata:
 
@@ -21,31 +32,66 @@ class Automata:
         self.name: str= name
         self.flask_process = None
         self.discord_process = None
+        self._stopping: bool = False
         (f"Instancia {self.name} se ha iniciado/reiniciado")
 
     def __start_flask(self) -> None:
-        self.flask_process = Process(target=run_server)
+        self.flask_process = Process(target=_run_service, args=(run_server,))
         self.flask_process.start()  # ✅ Esta línea es esencial
         logger.newLog(f"{self.name} ha iniciado el servidor Flask.")
 
     def __start_discordBot(self) -> None:
-        self.discord_process = Process(target=run_bot)
+        self.discord_process = Process(target=_run_service, args=(run_bot,))
         self.discord_process.start()
         logger.newLog(f"{self.name} se está iniciando en Discord.")
 
+    def _stop_processes(self) -> None:
+        # Solo los procesos que alcanzaron a iniciar tienen pid
+        processes = [p for p in (self.flask_process, self.discord_process) if p is not None and p.pid is not None]
+        for proc in processes:
+            proc.terminate()
+        # Un hijo que ignore SIGTERM no debe colgar el apagado
+        deadline = time.monotonic() + _STOP_TIMEOUT
+        for proc in processes:
+            proc.join(max(0.0, deadline - time.monotonic()))
+            if proc.is_alive():
+                proc.kill()
+                proc.join()
+
+    def _shutdown(self, signum=None, frame=None) -> None:
+        if self._stopping:
+            return
+        self._stopping = True
+        self._stop_processes()
+        if signum == signal.SIGINT:
+            logger.newLog("Automata detenido por el usuario.")
+            logger.newLog("Discord Bot detenido por el usuario.")
+
+    def _report_exit(self) -> None:
+        # El traceback del hijo ya sale por stderr; aquí solo queda constancia en el log
+        for service, proc in (("Flask", self.flask_process), ("Discord", self.discord_process)):
+            if proc.exitcode is not None:
+                logger.newLog(f"{self.name}: {service} terminó (código {proc.exitcode}). Deteniendo Automata.")
 
     def main(self):
+        # Ctrl+C detiene ambos servicios a la vez, incluso durante el arranque
+        signal.signal(signal.SIGINT, self._shutdown)
         # Start Flask instance
         self.__start_flask()
-        self.__start_discordBot()
-        try:
-            # Mantener el proceso principal vivo mientras Flask esté corriendo
-            self.flask_process.join()
-            self.discord_process.join()
-        except KeyboardInterrupt:
-            logger.newLog("Automata detenido por el usuario.")
-            logger.newLog("Discord Bot detenido por el usuario.")
-            #self.shutdown()
+        if not self._stopping:
+            self.__start_discordBot()
+        if self._stopping:
+            # Ctrl+C llegó mientras un servicio arrancaba; detenerlo también
+            self._stop_processes()
+            return
+        # Mantener el proceso principal vivo hasta que termine cualquiera de los dos
+        connection.wait([self.flask_process.sentinel, self.discord_process.sentinel])
+        if self._stopping:
+            return
+        self._report_exit()
+        self._shutdown()
+        # Ningún servicio debe terminar solo: salir con error para que un supervisor reinicie
+        sys.exit(1)
 
         # Stard Discord bot
 